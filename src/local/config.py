@@ -6,19 +6,48 @@ application
 """
 from __future__ import annotations
 
+import copy
+import filecmp
+import functools
 import os
+import pickle
+from collections.abc import Callable, Mapping
 from pathlib import Path
-from typing import Any, Literal
+from typing import IO, TYPE_CHECKING, Any, Literal
 
-import yaml
-from attrs import asdict, frozen
+from attrs import asdict, field, frozen, resolve_types
 
-from local.h2_adjust.timeseries import TimeseriesExtension
+from local.pydoit_nb.cache import get_cache_file, read_cache_file, write_cache_file
 from local.pydoit_nb.config_discovery import (
     load_config_fragment,
     merge_config_fragments,
 )
-from local.serialization import FrozenDict, converter_yaml, parse_placeholders
+from local.serialization import (
+    FrozenDict,
+    converter_yaml,
+    dump_yaml,
+    load_yaml,
+    parse_placeholders,
+)
+
+if TYPE_CHECKING:
+    # Importing this pulls in the scientific stack (scmdata, pandas, pyam) so
+    # we only do it when the configuration is actually structured
+    from local.h2_adjust.timeseries import TimeseriesExtension
+
+_WRITE_BUFFER_SIZE = 128 * 1024
+"""Buffer size (in bytes) used when writing hydrated configuration"""
+
+_CONFIG_CACHE_SOURCES = (
+    Path(__file__),
+    Path(__file__).parent / "serialization.py",
+    Path(__file__).parent / "h2_adjust" / "timeseries.py",
+)
+"""
+Modules defining the classes stored in the pickled configuration cache
+
+The cache is invalidated if any of these are modified
+"""
 
 
 @frozen
@@ -124,7 +153,7 @@ class TimeseriesOperation:
 
     filters: FrozenDict[str, Any]
     """Arguments to pass to :func:`scmdata.ScmRun.filter`"""
-    renames: list[Rename] = []
+    renames: list[Rename] = field(factory=list)
     """Metadata to update in the filtered metadata"""
 
 
@@ -595,6 +624,19 @@ def load_config_from_file(config_file: str) -> Config:
     """
     Load config from disk
 
+    Loaded configurations are cached in memory, keyed by the file's path,
+    modification time and size, so an unchanged file is only loaded once per
+    process. Each call returns a copy of the cached configuration so
+    modifying it doesn't affect any later loads.
+
+    The structured configuration is also cached as a pickle in the cache
+    directory (see :func:`local.pydoit_nb.cache.get_cache_dir`), keyed by the
+    path of ``config_file``. The pickle records the modification time and
+    size of ``config_file`` and of the modules defining the pickled classes.
+    Subsequent loads only use the pickle if these all match exactly, skipping
+    the YAML parsing and structuring. If the cache can't be written the
+    configuration is loaded without it.
+
     Parameters
     ----------
     config_file
@@ -604,12 +646,76 @@ def load_config_from_file(config_file: str) -> Config:
     -------
         Loaded configuration
     """
-    with open(config_file) as fh:
-        config = load_config(fh.read())
+    config_path = Path(config_file).absolute()
+    stat = config_path.stat()
+
+    return copy.deepcopy(
+        _load_config_from_file(config_path, stat.st_mtime_ns, stat.st_size)
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _load_config_from_file(config_path: Path, mtime_ns: int, size: int) -> Config:
+    cache_path = _get_config_cache_path(config_path)
+    cache_key = _get_config_cache_key(mtime_ns, size)
+
+    def _read(fh: IO[bytes]) -> Config | None:
+        # read_cache_file only passes on cache files which no other user could
+        # have written so they are safe to unpickle.
+        # The key is stored ahead of the configuration so a stale cache is
+        # detected without unpickling the configuration
+        if pickle.load(fh) != cache_key:  # noqa: S301
+            return None
+
+        return pickle.load(fh)  # type: ignore[no-any-return]  # noqa: S301
+
+    try:
+        cached = read_cache_file(cache_path, _read)
+    except (EOFError, pickle.UnpicklingError):
+        # Corrupt cache
+        cached = None
+
+    if cached is not None:
+        return cached
+
+    with open(config_path, encoding="utf-8") as fh:
+        # Parse directly from the file handle rather than reading it into a
+        # string first
+        config = _structure_config(load_yaml(fh))
+
+    _write_config_cache(config, cache_key, cache_path)
 
     return config
 
 
+def _get_config_cache_key(mtime_ns: int, size: int) -> tuple[int, ...]:
+    # A config can be replaced by one with an older modification time
+    # (e.g. ``cp -p``) so the cache is only valid for an exact match.
+    # The class definitions are baked into the pickle so a change to them
+    # must also invalidate the cache
+    return (
+        mtime_ns,
+        size,
+        *(p.stat().st_mtime_ns for p in _CONFIG_CACHE_SOURCES),
+    )
+
+
+def _get_config_cache_path(config_path: Path) -> Path:
+    # Kept outside of the directory containing the config, so the cache
+    # isn't included in the output bundle
+    return get_cache_file("config", config_path, ".pkl")
+
+
+def _write_config_cache(
+    config: Config, cache_key: tuple[int, ...], cache_path: Path
+) -> None:
+    def _write(fh: IO[bytes]) -> None:
+        pickle.dump(cache_key, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(config, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+    write_cache_file(cache_path, _write)
+
+
 def load_user_placeholders_from_file(
     placeholder_file: os.PathLike[str],
 ) -> UserPlaceholders:
@@ -618,6 +724,10 @@ def load_user_placeholders_from_file(
 
     Also verifies that all required values are present
 
+    Loaded placeholders are cached in memory, keyed by the file's path,
+    modification time and size, so the file is only parsed once per process
+    as long as it doesn't change.
+
     Parameters
     ----------
     placeholder_file
@@ -627,8 +737,21 @@ def load_user_placeholders_from_file(
     -------
         Loaded placeholders
     """
-    with open(placeholder_file) as fh:
-        config = converter_yaml.loads(fh.read(), UserPlaceholders)
+    placeholder_path = Path(placeholder_file).absolute()
+    stat = placeholder_path.stat()
+
+    return _load_user_placeholders_from_file(
+        placeholder_path, stat.st_mtime_ns, stat.st_size
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _load_user_placeholders_from_file(
+    placeholder_path: Path, mtime_ns: int, size: int
+) -> UserPlaceholders:
+    # mtime_ns and size are only used to invalidate the cache
+    with open(placeholder_path, encoding="utf-8") as fh:
+        config = converter_yaml.structure(load_yaml(fh), UserPlaceholders)
 
     return config
 
@@ -637,6 +760,10 @@ def load_config(config: str) -> Config:
     """
     Load config from a string
 
+    Results are cached in memory so the same string is only parsed once per
+    process. Each call returns a copy of the cached configuration so
+    modifying it doesn't affect any later loads.
+
     Parameters
     ----------
     config
@@ -646,7 +773,59 @@ def load_config(config: str) -> Config:
     -------
         Loaded configuration
     """
-    return converter_yaml.loads(config, Config)
+    return copy.deepcopy(_load_config(config))
+
+
+@functools.lru_cache(maxsize=64)
+def _load_config(config: str) -> Config:
+    return _structure_config(load_yaml(config))
+
+
+def _resolve_config_delta_emissions_types() -> None:
+    from local.h2_adjust.timeseries import TimeseriesExtension
+
+    # The annotation can't be resolved from the module's globals as the
+    # import is deferred so we resolve it here, before cattrs needs it
+    resolve_types(
+        ConfigDeltaEmissions,
+        localns={"TimeseriesExtension": TimeseriesExtension},
+    )
+
+
+def _is_config_delta_emissions(cls: Any) -> bool:
+    return cls is ConfigDeltaEmissions
+
+
+def _make_config_delta_emissions_structure_hook(cls: Any) -> Callable[..., Any]:
+    _resolve_config_delta_emissions_types()
+
+    return converter_yaml.gen_structure_attrs_fromdict(cls)
+
+
+def _make_config_delta_emissions_unstructure_hook(cls: Any) -> Callable[..., Any]:
+    _resolve_config_delta_emissions_types()
+
+    return converter_yaml.gen_unstructure_attrs_fromdict(cls)
+
+
+# The hooks are only generated the first time the converter needs them so
+# the scientific stack is still only imported when it is required
+converter_yaml.register_structure_hook_factory(
+    _is_config_delta_emissions, _make_config_delta_emissions_structure_hook
+)
+converter_yaml.register_unstructure_hook_factory(
+    _is_config_delta_emissions, _make_config_delta_emissions_unstructure_hook
+)
+
+
+@functools.cache
+def _get_config_structure_hook() -> Callable[[Mapping[str, Any], Any], Config]:
+    # Generated once per process and reused for every subsequent load
+    return converter_yaml.gen_structure_attrs_fromdict(Config)
+
+
+def _structure_config(raw: dict[str, Any]) -> Config:
+    return _get_config_structure_hook()(raw, Config)
 
 
 def get_config_bundle(
@@ -737,18 +916,23 @@ def get_config_bundle(
     }
 
     # Replace any placeholders
-    # Convert back to a string temporarily for the placeholder replacement
+    # This is done directly on the loaded values so the configuration doesn't
+    # have to be dumped back to YAML and parsed again
     # Preferences of the placeholders is: cli > user-specific > scenario
-    scenario_config_str = parse_placeholders(
-        yaml.safe_dump(scenario_config_with_placeholders),
-        **scenario_placeholders,
-        **asdict(user_placeholders),
-        **placeholders,
+    # The user placeholders are all simple values so there is nothing for
+    # asdict to recurse into
+    scenario_config = _fill_placeholders(
+        scenario_config_with_placeholders,
+        dict(
+            **scenario_placeholders,
+            **asdict(user_placeholders, recurse=False),
+            **placeholders,
+        ),
     )
 
     # Structure the configuration
     # Any missing values will cause an exception
-    config_hydrated = load_config(scenario_config_str)
+    config_hydrated = _structure_config(scenario_config)
 
     config_hydrated_path = (
         get_run_root_dir(output_root_dir, run_id) / stub / raw_config_file.name
@@ -765,6 +949,26 @@ def get_config_bundle(
     )
 
 
+def _fill_placeholders(fragment: Any, placeholders: dict[str, Any]) -> Any:
+    """
+    Replace the placeholders in all strings within a configuration fragment
+
+    Dictionary keys are sorted to match the order the configuration had when
+    it was round-tripped through YAML for the placeholder replacement
+    """
+    if isinstance(fragment, str):
+        return parse_placeholders(fragment, **placeholders)
+    if isinstance(fragment, dict):
+        return {
+            key: _fill_placeholders(value, placeholders)
+            for key, value in sorted(fragment.items())
+        }
+    if isinstance(fragment, list):
+        return [_fill_placeholders(value, placeholders) for value in fragment]
+
+    return fragment
+
+
 def get_run_root_dir(output_root_dir: Path, run_id: str) -> Path:
     """
     Get root directory for run
@@ -788,10 +992,26 @@ def write_config_file_in_output_dir(cb: ConfigBundle) -> None:
     """
     Write config file in output directory
 
+    The config is streamed to a temporary file which only replaces the
+    existing file if its contents differ. This keeps the modification time of
+    the hydrated config stable so that pydoit doesn't consider tasks which
+    depend on it out of date and means a partially written config is never
+    left behind.
+
     Parameters
     ----------
     cb
         Config bundle
     """
-    with open(cb.config_hydrated_path, "w") as fh:
-        fh.write(converter_yaml.dumps(cb.config_hydrated))
+    out_path = cb.config_hydrated_path
+    tmp_path = out_path.with_suffix(f"{out_path.suffix}.tmp")
+
+    # A large buffer means the dumper's many small writes are flushed to disk
+    # in one go
+    with open(tmp_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as fh:
+        dump_yaml(converter_yaml.unstructure(cb.config_hydrated), fh)
+
+    if out_path.exists() and filecmp.cmp(tmp_path, out_path, shallow=False):
+        tmp_path.unlink()
+    else:
+        tmp_path.replace(out_path)
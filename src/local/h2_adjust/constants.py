@@ -3,10 +3,10 @@ Constants from the h2-adjust process
 """
 from typing import Any
 
-from attrs import define
+from attrs import frozen
 
 
-@define
+@frozen
 class InputRequirement:
     """
     Filters to apply to an input file
@@ -16,34 +16,34 @@ class InputRequirement:
     checks: list[tuple[str, list[Any]]]
 
 
-R5_REGIONS = ["R5.2ASIA", "R5.2LAM", "R5.2MAF", "R5.2OECD", "R5.2REF"]
+R5_REGIONS = ("R5.2ASIA", "R5.2LAM", "R5.2MAF", "R5.2OECD", "R5.2REF")
 START_YEAR = 2015
 END_YEAR = 2100  # inclusive
 
-HYDROGEN_CARRIERS = [
+HYDROGEN_CARRIERS = (
     "H2",
     "NH3",
     "CH4",
     "Synthetic Fuels",
-]
+)
 
 # Sectors outside of this are ignored and any missing values are assumed to be zero
 # Sectors match final gridding sectors from CEDS
 # https://github.com/JGCRI/CEDS/blob/April-21-2021-release/input/gridding/gridding_mappings/CEDS_sector_to_gridding_sector_mapping.csv
-HYDROGEN_SECTORS = [
+HYDROGEN_SECTORS = (
     "International Shipping",
     "Energy Sector",
     "Aircraft",
     "Transportation Sector",
-]
+)
 
-WORLD_SECTORS = [
+WORLD_SECTORS = (
     "Aircraft",  # CEDS aggregates aviation emissions to a global total
     "International Shipping",  # CEDS uses global total for gridding
-]
+)
 
-HYDROGEN_PRODUCTS = ["H2", "NOx", "CH4", "NH3", "N2O"]
-DOWNSCALING_VARIABLES = [
+HYDROGEN_PRODUCTS = ("H2", "NOx", "CH4", "NH3", "N2O")
+DOWNSCALING_VARIABLES = (
     # H2
     "Emissions|H2|Energy Sector",
     "Emissions|H2|Transportation Sector",
@@ -66,7 +66,7 @@ DOWNSCALING_VARIABLES = [
     "Emissions|NH3|International Shipping",
     # N2O
     "Emissions|N2O",
-]
+)
 
 
 PALETTES = {
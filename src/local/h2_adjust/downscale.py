@@ -1,6 +1,7 @@
 """
 Routines for downscaling R5 regions to country timeseries
 """
+import functools
 
 import domestic_pathways  # type: ignore
 import scmdata  # type: ignore
@@ -8,7 +9,20 @@ from bookshelf import BookShelf  # type: ignore
 
 from local.h2_adjust.timeseries import to_pyam
 
-shelf = BookShelf()
+
+@functools.cache
+def _get_shelf() -> BookShelf:
+    # Created on first use rather than whenever this module is imported
+    return BookShelf()
+
+
+@functools.cache
+def _load_ssp_elements() -> scmdata.ScmRun:
+    # Loaded once and shared by the historical and projected elements
+    # Callers only ever filter this so it isn't modified
+    return (
+        _get_shelf().load("ssp-basic-elements", version="v2").timeseries("by_country")
+    )
 
 
 def get_historic_elements(ssp_scenario: str, end_year: int) -> scmdata.ScmRun:
@@ -28,27 +42,21 @@ def get_historic_elements(ssp_scenario: str, end_year: int) -> scmdata.ScmRun:
     -------
         Clean historical data
     """
-    ssp_elements = shelf.load("ssp-basic-elements", version="v2").timeseries(
-        "by_country"
-    )
+    ssp_elements = _load_ssp_elements()
 
-    gdp_historical = ssp_elements.filter(
-        variable="GDP|PPP",
+    # A single filter selects both variables in one pass over the data
+    historical = ssp_elements.filter(
+        variable=["GDP|PPP", "Population"],
         model="OECD Env-Growth",
         scenario=ssp_scenario,
+        year=range(1850, end_year + 1),
     )
 
-    # %%
-    pop_historical = ssp_elements.filter(
-        variable="Population",
-        model="OECD Env-Growth",
-        scenario=ssp_scenario,
-    )
+    n_gdp = (historical["variable"] == "GDP|PPP").sum()
+    n_pop = (historical["variable"] == "Population").sum()
+    assert n_gdp == n_pop  # noqa: S101
 
-    assert len(gdp_historical) == len(pop_historical)  # noqa: S101
-    return scmdata.run_append([gdp_historical, pop_historical]).filter(
-        year=range(1850, end_year + 1)
-    )
+    return historical
 
 
 def get_projected_elements(ssp_scenario: str, start_year: int) -> scmdata.ScmRun:
@@ -64,28 +72,15 @@ def get_projected_elements(ssp_scenario: str, start_year: int) -> scmdata.ScmRun
     -------
         Clean and filtered GDP and population data
     """
-    ssp_elements = shelf.load("ssp-basic-elements", version="v2").timeseries(
-        "by_country"
-    )
+    ssp_elements = _load_ssp_elements()
 
-    # %%
-    pop_projection = ssp_elements.filter(
-        variable="GDP|PPP",
+    return ssp_elements.filter(
+        variable=["GDP|PPP", "Population"],
         model="OECD Env-Growth",
         scenario=ssp_scenario,
         year=range(start_year, 2101),
     )
 
-    # %%
-    gdp_projection = ssp_elements.filter(
-        variable="Population",
-        model="OECD Env-Growth",
-        scenario=ssp_scenario,
-        year=range(start_year, 2101),
-    )
-
-    return scmdata.run_append([pop_projection, gdp_projection])
-
 
 def prepare_downscaler(
     ssp_scenario: str, cutover_year: int
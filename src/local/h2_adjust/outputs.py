@@ -1,12 +1,12 @@
 """
 input4MIPs dataset generation
 """
-import datetime as dt
+import fnmatch
 import logging
 import os
 import uuid
 from collections.abc import Iterable, Sequence
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -99,11 +99,25 @@ def _load_slice(filename: str | Path) -> xr.DataArray:
     da = xr.load_dataarray(filename)
 
     # input4MIPs flipped the lat axis compared to the proxies
-    da = da.reindex(lat=list(reversed(da.lat)))
+    # Reversing by position gives a view rather than a reindexed copy
+    da = da.isel(lat=slice(None, None, -1))
     assert da.lat[0] < da.lat[-1]  # noqa
     return da
 
 
+def _find_gridded_files(gridded_data_directory: Path) -> tuple[Path, ...]:
+    # Callers which look up many slices walk the directory once and reuse the
+    # result rather than globbing the whole tree for each slice. The result
+    # isn't cached between calls as files may be added in the meantime
+    # (e.g. in a long-running notebook kernel)
+    return tuple(
+        Path(root) / name
+        for root, _, files in os.walk(gridded_data_directory)
+        for name in files
+        if name.endswith(".nc")
+    )
+
+
 def find_gridded_slice(
     variable: str, sector: str, slice_years: str, gridded_data_directory: Path
 ) -> xr.DataArray | None:
@@ -126,10 +140,19 @@ def find_gridded_slice(
     -------
         If found the loaded slice
     """
-    matches = list(
-        gridded_data_directory.rglob(f"Emissions_{variable}_{sector}*_{slice_years}.nc")
+    return _find_gridded_slice(
+        variable, sector, slice_years, _find_gridded_files(gridded_data_directory)
     )
 
+
+def _find_gridded_slice(
+    variable: str, sector: str, slice_years: str, gridded_files: Iterable[Path]
+) -> xr.DataArray | None:
+    pattern = f"Emissions_{variable}_{sector}*_{slice_years}.nc"
+    matches = [
+        path for path in gridded_files if fnmatch.fnmatchcase(path.name, pattern)
+    ]
+
     if len(matches) > 1:
         raise ValueError(f"More than one match exists: {matches}")  # noqa
     if matches:
@@ -154,8 +177,24 @@ def check_dims(a: xr.DataArray, b: xr.DataArray, dimensions: Iterable[str]) -> N
     """
     assert a.shape == b.shape  # noqa
 
+    # The coordinates are compared directly rather than via
+    # xr.testing.assert_allclose which also aligns and compares metadata
     for d in dimensions:
-        xr.testing.assert_allclose(a[d], b[d])
+        a_values = a[d].to_numpy()
+        b_values = b[d].to_numpy()
+        if a_values.dtype.kind in "biufc":
+            assert np.allclose(a_values, b_values), d  # noqa
+        else:
+            assert np.array_equal(a_values, b_values), d  # noqa
+
+
+def _utc_now() -> datetime:
+    # Naive datetime in UTC, matching the format of the existing outputs
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _default_creation_date() -> str:
+    return _utc_now().isoformat()
 
 
 @define
@@ -165,7 +204,12 @@ class Input4MIPsMetadata:
     """
 
     contact: str
-    creation_date: str = field(init=False)
+    creation_date: str = field(factory=_default_creation_date, kw_only=True)
+    """
+    Defaults to the time the metadata are created
+
+    A single value can be passed to share a creation date across many datasets
+    """
     dataset_category: str
     frequency: str
     further_info_url: str
@@ -184,26 +228,28 @@ class Input4MIPsMetadata:
     activity_id: str = "input4MIPs"
     mip_era: str = "CMIP6"
 
-    def __attrs_post_init__(self):
-        """
-        Update the creation date
-        """
-        self.creation_date = datetime.utcnow().isoformat()
-
 
 def _generate_hdl() -> str:
-    return "hdl:21.14100/" + str(uuid.uuid4())
+    return f"hdl:21.14100/{uuid.uuid4()}"
 
 
 def _generate_bounds(points, bound_position=0.5):
-    diffs = np.diff(points)
-    diffs = np.insert(diffs, 0, diffs[0])
-    diffs = np.append(diffs, diffs[-1])
-
-    min_bounds = points - diffs[:-1] * bound_position
-    max_bounds = points + diffs[1:] * (1 - bound_position)
-
-    return np.array([min_bounds, max_bounds]).transpose()
+    points = np.asarray(points)
+    diffs = points[1:] - points[:-1]
+
+    # The first and last bounds use the spacing of their only neighbour
+    # The dtype of the bounds follows from the arithmetic so integer points
+    # (e.g. sectors) get float bounds and times keep their type
+    lower_diffs = np.concatenate((diffs[:1], diffs))
+    upper_diffs = np.concatenate((diffs, diffs[-1:]))
+
+    return np.stack(
+        (
+            points - lower_diffs * bound_position,
+            points + upper_diffs * (1 - bound_position),
+        ),
+        axis=1,
+    )
 
 
 class Input4MIPsDataset:
@@ -218,16 +264,30 @@ class Input4MIPsDataset:
 
     root_data_dir = "."
 
+    # Level 1 compresses substantially faster than higher levels for only
+    # slightly larger files
+    complevel = 1
+
     def __init__(self, data: xr.Dataset, metadata: Input4MIPsMetadata):
         self.data = data
         self.metadata = metadata
+        # The metadata are fixed once created so are only converted once
+        # All the fields are strings so there is nothing to recurse into
+        self._metadata_dict = asdict(metadata, recurse=False)
         # Version is related to creation date (has YYYYMMDD format). It isn't
         # the same as source_version which follows semVer (X.Y.Z). I don't
         # know why it's like this, it just seems to be what input4MIPs has
         # gone for.
-        version = dt.datetime.utcnow().strftime("%Y%m%d")
+        version = _utc_now().strftime("%Y%m%d")
         self.version = f"v{version}"
 
+        # Only the dates change between the filenames of different slices
+        # so the rest of the template values are prepared once
+        self._template_base = {
+            k: v.replace("_", "-")
+            for k, v in {"version": self.version, **self._metadata_dict}.items()
+        }
+
         self.prepare()
 
     def prepare(self) -> xr.Dataset:
@@ -246,8 +306,7 @@ class Input4MIPsDataset:
         for variable in self.dimensions:
             self._add_bounds(variable)
 
-        ds_metadata = asdict(self.metadata)
-        self.data.attrs.update(ds_metadata)
+        self.data.attrs.update(self._metadata_dict)
 
         self._update_lat()
         self._update_lon()
@@ -257,14 +316,11 @@ class Input4MIPsDataset:
 
     def _get_filename(self, **extra_kwargs):
         avail_metadata = {
-            "version": self.version,
-            **asdict(self.metadata),
-            **extra_kwargs,
+            **self._template_base,
+            **{k: v.replace("_", "-") for k, v in extra_kwargs.items()},
         }
-        for k in avail_metadata:
-            avail_metadata[k] = avail_metadata[k].replace("_", "-")
-        out_dir = self.directory_template.format(**avail_metadata)
-        out_fname = self.filename_template.format(**avail_metadata)
+        out_dir = self.directory_template.format_map(avail_metadata)
+        out_fname = self.filename_template.format_map(avail_metadata)
 
         return os.path.join(self.root_data_dir, out_dir, out_fname)
 
@@ -286,11 +342,22 @@ class Input4MIPsDataset:
         # Tracking id is unique for each file
         ds.attrs["tracking_id"] = _generate_hdl()
 
+        variable = ds[self.metadata.variable_id]
+        encoding: dict[str, Any] = {"zlib": True, "complevel": self.complevel}
+        # The encoding passed to xarray replaces any encoding on the variable
+        # so the chunk sizes have to be passed explicitly, in the order of
+        # the dimensions
+        chunksizes = variable.encoding.get("chunksizes")
+        if isinstance(chunksizes, dict):
+            encoding["chunksizes"] = tuple(
+                min(chunksizes[dim], size) for dim, size in variable.sizes.items()
+            )
+
         os.makedirs(os.path.dirname(out_fname), exist_ok=True)
         ds.to_netcdf(
             out_fname,
             unlimited_dims=("time",),
-            encoding={self.metadata.variable_id: {"zlib": True, "complevel": 5}},
+            encoding={self.metadata.variable_id: encoding},
         )
 
     def _update_lon(self):
@@ -355,6 +422,9 @@ class GriddedEmissionsDataset(Input4MIPsDataset):
         """
         Create an empty dataset
 
+        The data are stored as single precision floats, the same as the
+        input4MIPs emissions files.
+
         Parameters
         ----------
         sectors
@@ -382,10 +452,13 @@ class GriddedEmissionsDataset(Input4MIPsDataset):
             },
         )
         da = xr.DataArray(
-            data=np.zeros((len(time), len(sectors), len(lat), len(lon))),
+            data=np.full(
+                (len(time), len(sectors), len(lat), len(lon)),
+                np.nan,
+                dtype=np.float32,
+            ),
             coords=(time, sector_dimension, lat, lon),  # type: ignore
         )
-        da[:] = np.nan
         da.name = metadata.variable_id
 
         return cls(da.to_dataset(), metadata)
@@ -410,6 +483,9 @@ class GriddedAircraftEmissionsDataset(Input4MIPsDataset):
         """
         Create an empty file
 
+        The data are stored as single precision floats, the same as the
+        input4MIPs emissions files.
+
         Parameters
         ----------
         levels
@@ -434,10 +510,13 @@ class GriddedAircraftEmissionsDataset(Input4MIPsDataset):
             attrs={"long_name": "altitude", "units": "km"},
         )
         da = xr.DataArray(
-            data=np.zeros((len(time), len(level_dimension), len(lat), len(lon))),
+            data=np.full(
+                (len(time), len(level_dimension), len(lat), len(lon)),
+                np.nan,
+                dtype=np.float32,
+            ),
             coords=(time, level_dimension, lat, lon),  # type: ignore
         )
-        da[:] = np.nan
         da.name = metadata.variable_id
 
         return cls(da.to_dataset(), metadata)
@@ -514,6 +593,10 @@ def write_anthropogenic_slice(  # noqa: PLR0913
         }
     )
 
+    # The data are written straight into the underlying array once the
+    # coordinates have been checked, rather than via xarray's assignment
+    out = ds.data[variable_id].to_numpy()
+
     if baseline is not None:
         logger.info(f"Using baseline for {variable_id}")
         check_dims(
@@ -521,24 +604,23 @@ def write_anthropogenic_slice(  # noqa: PLR0913
             baseline[variable_id],
             ("lat", "sector", "lon", "time"),
         )
-        ds.data[variable_id][:] = baseline[variable_id][:]
+        out[:] = baseline[variable_id].transpose(*ds.dimensions).to_numpy()
 
+    # Listed once for all the sectors
+    gridded_files = _find_gridded_files(gridded_data_directory)
     for sector_idx, sector in enumerate(SECTOR_MAP):
-        new_data = find_gridded_slice(
-            output_variable,
-            sector,
-            years_slice,
-            gridded_data_directory=gridded_data_directory,
+        new_data = _find_gridded_slice(
+            output_variable, sector, years_slice, gridded_files
         )
 
         if new_data is not None:
+            sector_data = ds.data[variable_id].isel(sector=sector_idx)
             check_dims(
-                ds.data[variable_id].isel(sector=sector_idx).drop(("sector",)),  # type: ignore
+                sector_data.drop(("sector",)),  # type: ignore
                 new_data,
                 ("lat", "lon", "time"),
             )
-            # This will explode if not lined up correctly
-            ds.data[variable_id][:, sector_idx] = new_data[:]
+            out[:, sector_idx] = new_data.transpose(*sector_data.dims).to_numpy()
 
     # These sizes come from the input4MIPs data
     ds.data[variable_id].encoding.update(
@@ -601,16 +683,20 @@ def write_anthropogenic_AIR_slice(  # noqa: PLR0913
     )
     del ds.data["level_bounds"]
 
+    # The data are written straight into the underlying array once the
+    # coordinates have been checked, rather than via xarray's assignment
+    out = ds.data[variable_id].to_numpy()
+
     if baseline is not None:
         logger.info(f"Using baseline for {variable_id}")
         check_dims(
             ds.data[variable_id], baseline[variable_id], ("level", "lat", "lon", "time")
         )
 
-        # Override the level dimension. There might be floating point errors which cause xr to explode
-        baseline["level"] = ds.data.level
+        # The data are written straight into the underlying array, so
+        # floating point differences in the level dimension don't matter
         assert ds.data[variable_id].shape == baseline[variable_id].shape  # noqa
-        ds.data[variable_id][:] = baseline[variable_id][:]
+        out[:] = baseline[variable_id].transpose(*ds.dimensions).to_numpy()
 
     updated_data = find_gridded_slice(
         output_variable,
@@ -626,7 +712,7 @@ def write_anthropogenic_AIR_slice(  # noqa: PLR0913
             ("level", "lat", "lon", "time"),
         )
 
-        ds.data[variable_id][:] = updated_data[:]
+        out[:] = updated_data.to_numpy()
     # These sizes come from the input4MIPs data
     ds.data[variable_id].encoding.update(
         {"chunksizes": {"time": 1, "level": 13, "lat": 180, "lon": 360}}
@@ -34,37 +34,72 @@ class TimeseriesExtension:
     """When to stop applying the extension"""
 
 
-def _apply_extension(
-    extension: TimeseriesExtension, run: scmdata.ScmRun
-) -> scmdata.ScmRun:
+def _apply_extension(extension: TimeseriesExtension, ts: pd.DataFrame) -> pd.DataFrame:
+    # ts holds all the timeseries being extended. Missing values (NaN) mark
+    # the times which aren't defined for a given timeseries
     # Try filter
+    # ScmRun modifies the frame it is created from so it is given a copy
     try:
-        filtered: scmdata.ScmRun = run.filter(**extension.filters, log_if_empty=False)
+        filtered: scmdata.ScmRun = scmdata.ScmRun(ts.copy()).filter(
+            **extension.filters, log_if_empty=False
+        )
     except ValueError:
         # Invalid filters provided. Skip this extension
-        filtered = scmdata.ScmRun()
+        return ts
     if not len(filtered):
-        return run
+        return ts
 
     logger.info(f"Extending using {extension}")
 
+    is_filtered = ts.index.isin(filtered.timeseries().index)
+    to_extend = ts[is_filtered]
+    years = to_extend.columns.year.to_numpy()
+    is_valid = to_extend.notna().to_numpy()
+
     # Apply rate extension
-    start_year = max(
-        extension.start_year,
-        filtered["year"].min(),
-    )
-    if start_year not in filtered["year"].tolist():
-        raise ValueError(f"{start_year} not present")  # noqa: TRY003
+    # Each timeseries starts from its first value if that is after the start
+    # of the extension
+    start_years = np.maximum(extension.start_year, years[is_valid.argmax(axis=1)])
+    has_start = (is_valid & (years == start_years[:, np.newaxis])).any(axis=1)
+    if not has_start.all():
+        raise ValueError(f"{start_years[~has_start][0]} not present")  # noqa: TRY003
     end_year = extension.end_year
 
-    extrapolated = filtered.interpolate(
-        np.arange(str(start_year), str(end_year + 1), dtype="datetime64[Y]"),
-        extrapolation_type="constant",
-    ).timeseries()
+    extended = []
+    for start_year in np.unique(start_years):
+        extrapolated = (
+            scmdata.ScmRun(to_extend[start_years == start_year])
+            .interpolate(
+                np.arange(str(start_year), str(end_year + 1), dtype="datetime64[Y]"),
+                extrapolation_type="constant",
+            )
+            .timeseries()
+        )
+
+        values = extrapolated.to_numpy()
+        if extension.rate == 0:
+            # Held constant at the value in the start year
+            values[:, 1:] = values[:, :1]
+        else:
+            # Compound the rate from the value in the start year
+            values[:, 1:] = 1 + extension.rate
+            values = np.cumprod(values, axis=1)
+
+        extended.append(
+            pd.DataFrame(
+                values,
+                index=extrapolated.index,
+                columns=extrapolated.columns,
+            )
+        )
 
-    for i in range(1, extrapolated.shape[1]):
-        extrapolated.iloc[0, i] = extrapolated.iloc[0, i - 1] * (1 + extension.rate)
-    return scmdata.ScmRun(extrapolated)
+    # The extended timeseries are only defined over the extension
+    # so replace them entirely
+    extended_ts = pd.concat(extended)
+
+    return pd.concat([ts[~is_filtered], extended_ts]).reindex(
+        index=ts.index, columns=ts.columns.union(extended_ts.columns)
+    )
 
 
 def extend(
@@ -92,27 +127,18 @@ def extend(
     end_year
         Year which the output timeseries should end (inclusive)
     """
-    res = []
-    data = scmdata.ScmRun(data.timeseries().dropna(how="all").dropna(how="all", axis=1))
-    ts = data.timeseries()
-
-    def _extend(df: pd.DataFrame) -> scmdata.ScmRun:
-        clean_run = scmdata.ScmRun(df.dropna(how="all").dropna(how="all", axis=1))
-        assert len(clean_run) == 1  # noqa: S101
-
-        for extension in extensions:
-            clean_run = _apply_extension(extension, clean_run)
+    # All the timeseries are extended together. Each timeseries is still
+    # treated independently as missing values are ignored when interpolating
+    ts = data.timeseries().dropna(how="all").dropna(how="all", axis=1)
 
-        # Finally use default extrapolation
-        return clean_run.interpolate(
-            np.arange(str(start_year), str(end_year + 1), dtype="datetime64[Y]"),
-            extrapolation_type=method,
-        )
-
-    for i in range(len(data)):
-        res.append(_extend(ts.iloc[[i]]))
+    for extension in extensions:
+        ts = _apply_extension(extension, ts)
 
-    return scmdata.run_append(res)
+    # Finally use default extrapolation
+    return scmdata.ScmRun(ts).interpolate(
+        np.arange(str(start_year), str(end_year + 1), dtype="datetime64[Y]"),
+        extrapolation_type=method,
+    )
 
 
 def add_world_region(data: scmdata.ScmRun, method: str = "sum") -> scmdata.ScmRun:
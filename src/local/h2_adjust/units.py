@@ -1,8 +1,12 @@
 """
 Additional project specific units
 """
+import functools
+from collections.abc import Callable
 from typing import Any
 
+import numpy as np
+import pandas as pd
 import scmdata
 from scmdata.units import UNIT_REGISTRY, UnitConverter
 
@@ -24,11 +28,46 @@ def _get_unit_scaling(source_unit: str | Any, target_unit: str) -> float:
     if not isinstance(source_unit, str):
         raise ValueError(source_unit)  # noqa: TRY004
 
+    return _get_cached_unit_scaling(source_unit, target_unit)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_cached_unit_scaling(source_unit: str, target_unit: str) -> float:
+    # Only a handful of unit pairs are converted, but each is requested for
+    # every timeseries so the converter is only built once per pair
     uc = UnitConverter(source_unit, target_unit)
 
     return uc.convert_from(1)
 
 
+def _apply_conversions(
+    intensities: scmdata.ScmRun,
+    meta_columns: list[str],
+    get_conversion: Callable[..., tuple[float, str]],
+) -> scmdata.ScmRun:
+    if intensities.empty:
+        # Nothing to convert and the metadata columns may not even exist
+        return intensities.copy()
+
+    # The conversions only depend on a few metadata columns so they are
+    # calculated once for each unique combination of those columns and then
+    # applied to all the values at once
+    meta = intensities.meta
+    scales = np.empty(len(meta))
+    target_units = np.empty(len(meta), dtype=object)
+    for key, idx in meta.groupby(
+        meta_columns, sort=False, dropna=False
+    ).indices.items():
+        scales[idx], target_units[idx] = get_conversion(*key)
+
+    # Rows of the timeseries are in the same order as the metadata
+    ts = intensities.timeseries()
+    ts = ts.mul(scales, axis=0)
+    ts.index = pd.MultiIndex.from_frame(meta.assign(unit=target_units))
+
+    return scmdata.ScmRun(ts)
+
+
 def sanitize_combustion_intensity_units(
     intensities: scmdata.ScmRun, energy_unit: str = "MWh", mass_unit: str = "kg"
 ) -> scmdata.ScmRun:
@@ -38,9 +77,7 @@ def sanitize_combustion_intensity_units(
     Default target unit is "kg X / MWh"
     """
 
-    def _convert_intensities(ts: scmdata.ScmRun):
-        product: str = ts.get_unique_meta("product", True)
-        unit: str = ts.get_unique_meta("unit", True)
+    def _get_conversion(unit: str, product: str) -> tuple[float, str]:
         target_unit = f"{mass_unit} {product} / {energy_unit}"
 
         try:
@@ -48,11 +85,9 @@ def sanitize_combustion_intensity_units(
         except ValueError as e:
             raise SanitizeError(unit, target_unit) from e
 
-        result = ts * scale
-        result["unit"] = target_unit
-        return result
+        return scale, target_unit
 
-    return intensities.apply(_convert_intensities)
+    return _apply_conversions(intensities, ["unit", "product"], _get_conversion)
 
 
 def h2_mass_factor(species: str):
@@ -61,34 +96,10 @@ def h2_mass_factor(species: str):
 
     This assumes that the mass of H is preserved during the conversion.
     """
-    if species == "H2":
-        # H2 -> 2H
-        factor = get_mass_equivalence(
-            molar_mass_a=2,
-            molar_mass_b=1,
-            stoichiometric_coefficient_a=1,
-            stoichiometric_coefficient_b=2,
-        )
-    elif species == "CH4":
-        # CO2 + 4H2 -> CH4 + 2H20 (over catalysts)
-        factor = get_mass_equivalence(
-            molar_mass_a=2,
-            molar_mass_b=12 + 4,
-            stoichiometric_coefficient_a=4,
-            stoichiometric_coefficient_b=1,
-        )
-    elif species == "NH3":
-        # 3H2 + N2 -> 2NH3 (Haber Bosch process)
-        factor = get_mass_equivalence(
-            molar_mass_a=1,
-            molar_mass_b=14 + 3,
-            stoichiometric_coefficient_a=3,
-            stoichiometric_coefficient_b=1,
-        )
-    else:
-        raise ValueError(species)
-
-    return factor
+    try:
+        return _H2_MASS_FACTORS[species]
+    except KeyError as e:
+        raise ValueError(species) from e
 
 
 def get_mass_equivalence(
@@ -128,6 +139,32 @@ def get_mass_equivalence(
     )
 
 
+# Calculated once as they only depend on the species
+_H2_MASS_FACTORS = {
+    # H2 -> 2H
+    "H2": get_mass_equivalence(
+        molar_mass_a=2,
+        molar_mass_b=1,
+        stoichiometric_coefficient_a=1,
+        stoichiometric_coefficient_b=2,
+    ),
+    # CO2 + 4H2 -> CH4 + 2H20 (over catalysts)
+    "CH4": get_mass_equivalence(
+        molar_mass_a=2,
+        molar_mass_b=12 + 4,
+        stoichiometric_coefficient_a=4,
+        stoichiometric_coefficient_b=1,
+    ),
+    # 3H2 + N2 -> 2NH3 (Haber Bosch process)
+    "NH3": get_mass_equivalence(
+        molar_mass_a=1,
+        molar_mass_b=14 + 3,
+        stoichiometric_coefficient_a=3,
+        stoichiometric_coefficient_b=1,
+    ),
+}
+
+
 def sanitize_production_intensity_units(
     intensities: scmdata.ScmRun, mass_unit: str = "kg"
 ) -> scmdata.ScmRun:
@@ -137,11 +174,7 @@ def sanitize_production_intensity_units(
     Default target unit is "kg Product / kg H2"
     """
 
-    def _convert_intensities(ts: scmdata.ScmRun):
-        product: str = ts.get_unique_meta("product", True)
-        carrier: str = ts.get_unique_meta("carrier", True)
-        unit: str = ts.get_unique_meta("unit", True)
-
+    def _get_conversion(unit: str, product: str, carrier: str) -> tuple[float, str]:
         target_unit = (
             f"{mass_unit} {product if product != 'H2' else 'H'} / {mass_unit} H"
         )
@@ -180,8 +213,8 @@ def sanitize_production_intensity_units(
         except (SanitizeError, ValueError) as e:
             raise SanitizeError(unit, target_unit) from e
 
-        result = ts * scale
-        result["unit"] = target_unit
-        return result
+        return scale, target_unit
 
-    return intensities.apply(_convert_intensities)
+    return _apply_conversions(
+        intensities, ["unit", "product", "carrier"], _get_conversion
+    )
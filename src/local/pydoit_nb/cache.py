@@ -0,0 +1,174 @@
+"""
+On-disk caches
+
+Caches are kept outside of the directories that they describe so they never
+end up in any generated outputs (e.g. bundles uploaded to Zenodo or
+checklists).
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import stat
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO, Any, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV_VAR = "PYDOIT_NB_CACHE_DIR"
+"""Environment variable which overrides the location of the caches"""
+
+MAX_CACHE_FILES = 32
+"""
+Maximum number of files kept for each type of cache
+
+Caches are keyed by path and outputs are written to a new directory for each
+run so older caches are pruned rather than being kept forever
+"""
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the root directory for caches
+
+    Defaults to ``pydoit_nb`` within ``$XDG_CACHE_HOME`` (``~/.cache`` if not
+    set). This can be overridden using the ``PYDOIT_NB_CACHE_DIR``
+    environment variable.
+
+    Returns
+    -------
+        Root directory for caches
+    """
+    if CACHE_DIR_ENV_VAR in os.environ:
+        return Path(os.environ[CACHE_DIR_ENV_VAR])
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(xdg_cache_home) / "pydoit_nb"
+
+
+def get_cache_file(namespace: str, path: Path, suffix: str) -> Path:
+    """
+    Get the cache file for a given path
+
+    Parameters
+    ----------
+    namespace
+        Type of cache, each is stored in a separate directory
+
+    path
+        File or directory which is cached
+
+        The cache is keyed by the absolute path
+
+    suffix
+        Suffix of the cache file
+
+    Returns
+    -------
+        Location of the cache file. This file may not exist yet.
+    """
+    key = hashlib.sha256(str(Path(path).absolute()).encode("utf-8")).hexdigest()
+
+    return get_cache_dir() / namespace / f"{key}{suffix}"
+
+
+def _is_trusted(cache_stat: os.stat_result) -> bool:
+    # Only files which no other user could have written are trusted
+    if cache_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        return False
+
+    if hasattr(os, "getuid"):
+        return cache_stat.st_uid == os.getuid()
+
+    return True
+
+
+def read_cache_file(cache_file: Path, read: Callable[[IO[bytes]], T]) -> T | None:
+    """
+    Read a cache file
+
+    Caches may be unpickled, so a cache file is ignored unless it is owned by
+    the current user and can't be written by anyone else.
+
+    Parameters
+    ----------
+    cache_file
+        Cache file to read
+
+    read
+        Function which reads the contents of the cache from an open binary file
+
+    Returns
+    -------
+        Result of ``read`` or ``None`` if the cache is missing, unreadable or
+        untrusted
+    """
+    try:
+        with open(cache_file, "rb") as fh:
+            if not _is_trusted(os.fstat(fh.fileno())):
+                logger.debug("Ignoring untrusted cache %s", cache_file)
+                return None
+
+            return read(fh)
+    except OSError:
+        return None
+
+
+def write_cache_file(cache_file: Path, write: Callable[[IO[bytes]], Any]) -> None:
+    """
+    Write a cache file
+
+    The cache is written to a uniquely named temporary file which then
+    replaces any existing cache so concurrent writers don't clash and readers
+    never see a partially written cache. Once written, the least recently
+    written files of the same type of cache are removed so at most
+    :data:`MAX_CACHE_FILES` are kept. A cache is only an optimisation so any
+    :class:`OSError` while writing is logged and otherwise ignored.
+
+    Parameters
+    ----------
+    cache_file
+        Cache file to write
+
+    write
+        Function which writes the contents of the cache to an open binary file
+    """
+    tmp_path = None
+    try:
+        # Only the current user can read and write the caches
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_file.parent,
+            prefix=f"{cache_file.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as fh:
+            tmp_path = Path(fh.name)
+            write(fh)
+        os.replace(tmp_path, cache_file)
+        _prune_cache_dir(cache_file.parent)
+    except OSError:
+        logger.debug("Could not write cache %s", cache_file, exc_info=True)
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _prune_cache_dir(cache_dir: Path) -> None:
+    mtimes = {}
+    for path in cache_dir.iterdir():
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # Already removed by another process
+            continue
+
+    # The most recently written files are kept
+    newest_first = sorted(mtimes, key=mtimes.__getitem__, reverse=True)
+    for path in newest_first[MAX_CACHE_FILES:]:
+        path.unlink(missing_ok=True)
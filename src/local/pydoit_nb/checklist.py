@@ -2,13 +2,46 @@
 Checklist file generation
 """
 
+import hashlib
+import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
-from doit.dependency import get_file_md5  # type: ignore
+from local.pydoit_nb.cache import get_cache_file, write_cache_file
 
 _CHECKLIST_FNAME = "checklist.chk"
 
 
+def _get_file_md5(path: Path) -> str:
+    # Hashes the whole file in one call rather than in many small chunks
+    with open(path, "rb") as fh:
+        if hasattr(hashlib, "file_digest"):
+            # Python >= 3.11
+            return hashlib.file_digest(fh, "md5").hexdigest()
+
+        if not path.stat().st_size:
+            # Empty files can't be memory-mapped
+            return hashlib.md5().hexdigest()  # noqa: S324
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.md5(mm).hexdigest()  # noqa: S324
+
+
+def _load_checklist_cache(cache_file: Path) -> dict[str, list[Any]]:
+    try:
+        with open(cache_file, encoding="utf-8") as fh:
+            return json.load(fh)  # type: ignore[no-any-return]
+    except (OSError, ValueError):
+        # A missing or corrupt cache means every file is hashed
+        return {}
+
+
+def _write_checklist_cache(cache: dict[str, list[Any]], cache_file: Path) -> None:
+    write_cache_file(cache_file, lambda fh: fh.write(json.dumps(cache).encode()))
+
+
 def get_checklist_file(directory: Path) -> Path:
     """
     Get the filename for a checklist
@@ -42,6 +75,14 @@ def generate_directory_checklist(directory: Path) -> Path:
 
         md5sum -c checklist.chk
 
+    The checksums are cached, keyed by each file's modification time and
+    size, so only new or modified files are hashed when the checklist is
+    regenerated. The cache is stored in the cache directory (see
+    :func:`local.pydoit_nb.cache.get_cache_dir`) rather than in
+    ``directory`` so it isn't distributed with the results. Only the caches
+    for the most recently checksummed directories are kept (see
+    :data:`local.pydoit_nb.cache.MAX_CACHE_FILES`).
+
     Parameters
     ----------
     directory
@@ -60,15 +101,43 @@ def generate_directory_checklist(directory: Path) -> Path:
         raise NotADirectoryError(directory)
 
     checklist_file = get_checklist_file(directory)
-
-    files = sorted(directory.rglob("*"))
+    cache_file = get_cache_file("checklist", directory, ".json")
+
+    # Ignores checklist files recursively
+    files = sorted(
+        f for f in directory.rglob("*") if f.name != _CHECKLIST_FNAME and f.is_file()
+    )
+
+    rel_paths = [f.relative_to(directory).as_posix() for f in files]
+
+    previous_cache = _load_checklist_cache(cache_file)
+    cache: dict[str, list[Any]] = {}
+    to_hash = []
+    for f, rel_path in zip(files, rel_paths):
+        stat = f.stat()
+        cached = previous_cache.get(rel_path)
+        if cached is not None and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+            cache[rel_path] = cached
+        else:
+            cache[rel_path] = [stat.st_mtime_ns, stat.st_size, None]
+            to_hash.append((rel_path, f))
+
+    # Hashing releases the GIL so files are hashed concurrently. map returns
+    # the results in the same order as the files
+    with ThreadPoolExecutor() as executor:
+        file_md5s = executor.map(_get_file_md5, (f for _, f in to_hash))
+        for (rel_path, _), file_md5 in zip(to_hash, file_md5s):
+            cache[rel_path][2] = file_md5
+
+    # Formatted the same as the results from md5sum
+    lines = [
+        f"MD5 ({f.relative_to(directory)}) = {cache[rel_path][2]}\n"
+        for f, rel_path in zip(files, rel_paths)
+    ]
 
     with open(checklist_file, "w") as fh:
-        for f in files:
-            # Ignores checklist files recursively
-            if f.is_file() and f.stem != _CHECKLIST_FNAME:
-                file_md5 = get_file_md5(f)
-                # Formatted the same as the results from md5sum
-                fh.write(f"MD5 ({f.relative_to(directory)}) = {file_md5}\n")
+        fh.writelines(lines)
+
+    _write_checklist_cache(cache, cache_file)
 
     return checklist_file
@@ -3,12 +3,15 @@ Tools to help with config discovery and handling
 """
 from __future__ import annotations
 
-from collections.abc import Iterable
+import copy
+import fnmatch
+import functools
+import os
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
-import deepmerge  # type: ignore
-import yaml
+from local.serialization import load_yaml
 
 ConfigFragment = dict[str, Any]
 
@@ -29,7 +32,23 @@ def glob_config_files(config_directory: Path, config_glob: str) -> Iterable[Path
     -------
         Found files that match the glob
     """
-    return config_directory.glob(config_glob)
+    if "**" in config_glob or "/" in config_glob or os.sep in config_glob:
+        # Only single-level patterns (e.g. "*.yaml") are matched directly
+        return config_directory.glob(config_glob)
+
+    return _scan_config_files(config_directory, config_glob)
+
+
+def _scan_config_files(config_directory: Path, config_glob: str) -> Iterator[Path]:
+    # A single directory listing matched by name, the same as Path.glob.
+    # fnmatch is only case-insensitive where the platform paths are
+    if not config_directory.is_dir():
+        return
+
+    with os.scandir(config_directory) as entries:
+        for entry in entries:
+            if fnmatch.fnmatch(entry.name, config_glob):
+                yield config_directory / entry.name
 
 
 def load_config_fragment(filename: Path) -> ConfigFragment:
@@ -39,6 +58,12 @@ def load_config_fragment(filename: Path) -> ConfigFragment:
     This configuration fragment may be a subset of a complete :class:`Config`
     and may also include some placeholders that will be filled in later.
 
+    Parsed fragments are cached in memory, keyed by the file's path,
+    modification time and size, so a fragment shared by many configurations
+    (e.g. the common configuration) is only parsed once per process. A copy
+    is returned each time so the fragment can be modified (e.g. by
+    :func:`merge_config_fragments`) without affecting the cache.
+
     Parameters
     ----------
     filename
@@ -50,10 +75,17 @@ def load_config_fragment(filename: Path) -> ConfigFragment:
     -------
         Fragment of a :class:`Config` object
     """
-    with open(filename) as fh:
-        resp = fh.read()
+    path = Path(filename).absolute()
+    stat = path.stat()
 
-    return yaml.safe_load(resp)
+    return copy.deepcopy(_load_config_fragment(path, stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_fragment(path: Path, mtime_ns: int, size: int) -> ConfigFragment:
+    # mtime_ns and size are only used to invalidate the cache
+    # libyaml decodes the raw bytes itself
+    return load_yaml(path.read_bytes())
 
 
 def merge_config_fragments(
@@ -91,17 +123,17 @@ def merge_config_fragments(
     """
     # Aggressive merging strategy which always preferences the updated value
     # and replaces any matching lists/sets rather than the default behaviour
-    # of merging
-    merge_strategies = (
-        (list, "override"),
-        (dict, "merge"),
-        (set, "override"),
-    )
-    merger = deepmerge.Merger(merge_strategies, ["override"], ["override"])
-
-    res = base
-
+    # of merging. Only dicts which are present in both fragments are merged.
+    # The merge is done with an explicit stack rather than by recursion.
     for fragment in fragments:
-        res = merger.merge(res, fragment)
-
-    return res
+        to_merge = [(base, fragment)]
+        while to_merge:
+            res, update = to_merge.pop()
+            for key, value in update.items():
+                current = res.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    to_merge.append((current, value))
+                else:
+                    res[key] = value
+
+    return base
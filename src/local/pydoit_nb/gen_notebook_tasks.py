@@ -3,11 +3,13 @@ Utility wrappers around :mod:`pydoit`
 """
 from __future__ import annotations
 
+import functools
 import os
-from collections.abc import Hashable, Iterable, Iterator
+from collections.abc import Hashable, Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Any, Protocol
 
+from attrs import fields, has
 from doit.tools import config_changed  # type: ignore
 
 from local.pydoit_nb.notebooks import run_notebook
@@ -57,6 +59,42 @@ class SupportsGenNotebookTasks(Protocol):
     """Additional parameters to pass to the notebook"""
 
 
+def _get_typed_key(value: Any) -> Hashable:
+    # Equal values of different types (e.g. 1, 1.0 and True) are dumped
+    # differently so the type of every value is included in the key
+    children: Iterable[Any]
+    if has(type(value)):
+        children = (getattr(value, a.name) for a in fields(type(value)))
+    elif isinstance(value, (tuple, frozenset)):
+        children = value
+    elif isinstance(value, Mapping):
+        children = (item for kv in value.items() for item in kv)
+    else:
+        return (type(value), value)
+
+    return (type(value), tuple(_get_typed_key(child) for child in children))
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _dump_hashable_configuration(typed_key: Hashable, configuration: Hashable) -> str:
+    # typed_key is only used to distinguish configurations which are equal
+    # but contain values of different types
+    return converter_yaml.dumps(configuration, sort_keys=True)
+
+
+def _dump_configuration(configuration: Hashable) -> str:
+    # The same configuration is often shared by several steps and tasks can
+    # be generated more than once, so the serialised form is cached
+    try:
+        return _dump_hashable_configuration(
+            _get_typed_key(configuration), configuration
+        )
+    except TypeError:
+        # Not every configuration can actually be hashed (e.g. if it
+        # contains lists) so those are serialised each time
+        return converter_yaml.dumps(configuration, sort_keys=True)
+
+
 def gen_run_notebook_tasks(
     notebook_steps: Iterable[SupportsGenNotebookTasks],
     config_file: os.PathLike,
@@ -122,9 +160,7 @@ def gen_run_notebook_tasks(
 
         if step.configuration is not None:
             task["uptodate"] = (
-                config_changed(
-                    converter_yaml.dumps(step.configuration, sort_keys=True),
-                ),
+                config_changed(_dump_configuration(step.configuration)),
             )
         else:
             # Trigger the notebook whenever the configuration file changes
@@ -8,10 +8,20 @@ sure it's worth making general pattern assumptions yet.
 from __future__ import annotations
 
 import copyreg
+import re
 from pathlib import Path
-from typing import Any, TypeVar, get_origin
+from typing import IO, Any, TypeVar, get_origin
 
 import cattrs.preconf.pyyaml
+import yaml
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    # PyYAML was built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
 converter_yaml = cattrs.preconf.pyyaml.make_converter()
 """Yaml serializer"""
@@ -68,10 +78,20 @@ converter_yaml.register_structure_hook_func(
 )
 
 
+_PLACEHOLDER_RE = re.compile(r"\{\{|\}\}|\{(\w+)\}|[{}]")
+"""
+Pattern matching a ``{placeholder}``, an escaped brace (``{{`` or ``}}``) or a
+lone brace
+"""
+
+
 def parse_placeholders(in_str: str, **kwargs: Any) -> str:
     """
     Parse placeholders in a raw string
 
+    All placeholders are replaced in a single pass over the string. Escaped
+    braces (``{{`` and ``}}``) are handled the same way as :meth:`str.format`.
+
     Parameters
     ----------
     in_str
@@ -80,6 +100,15 @@ def parse_placeholders(in_str: str, **kwargs: Any) -> str:
     **kwargs
         Replacements to be made
 
+    Raises
+    ------
+    KeyError
+        A placeholder in ``in_str`` has no matching replacement
+
+    ValueError
+        ``in_str`` contains a lone ``{`` or ``}`` which isn't part of a valid
+        placeholder (e.g. ``{output-root-dir}`` or an unclosed ``{name``)
+
     Returns
     -------
         String, with all appearances of ``{kwarg}`` replaced by their value
@@ -87,6 +116,61 @@ def parse_placeholders(in_str: str, **kwargs: Any) -> str:
     Examples
     --------
     >>> parse_placeholders("Hi I am {name}!", name="Tim")
-    'Hi I am Tim'
+    'Hi I am Tim!'
+    """
+    if "{" not in in_str and "}" not in in_str:
+        # Nothing to replace so skip the regex
+        return in_str
+
+    def _replace(match: re.Match[str]) -> str:
+        key = match.group(1)
+        if key is None:
+            if len(match.group(0)) == 1:
+                raise ValueError(  # noqa: TRY003
+                    f"Malformed placeholder at position {match.start()} in {in_str!r}"
+                )
+
+            # Escaped brace
+            return match.group(0)[0]
+
+        return str(kwargs[key])
+
+    return _PLACEHOLDER_RE.sub(_replace, in_str)
+
+
+def load_yaml(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """
+    Safely load YAML
+
+    Uses the libyaml-backed loader if PyYAML was built with libyaml support,
+    otherwise falls back to the pure-Python loader
+
+    Parameters
+    ----------
+    stream
+        YAML string or an open file handle
+
+    Returns
+    -------
+        Loaded data
+    """
+    return yaml.load(stream, Loader=_SafeLoader)
+
+
+def dump_yaml(data: Any, stream: IO[str]) -> None:
+    """
+    Safely dump YAML to a stream
+
+    Uses the libyaml-backed dumper if PyYAML was built with libyaml support,
+    otherwise falls back to the pure-Python dumper. The output is the same as
+    :func:`yaml.safe_dump`.
+
+    Parameters
+    ----------
+    data
+        Data to dump
+
+    stream
+        Open file handle to write to
     """
-    return in_str.format(**kwargs)
+    yaml.dump(data, stream, Dumper=_SafeDumper)
@@ -6,6 +6,7 @@ We have two sets of notebooks that are run:
 * historical - Set of common steps that only need to be run once
 * scenario - Set of steps that are run for each unique configuration bundle
 """
+import functools
 import itertools
 from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
@@ -16,6 +17,13 @@ from local.pydoit_nb.checklist import get_checklist_file
 from local.pydoit_nb.gen_notebook_tasks import gen_run_notebook_tasks
 from local.pydoit_nb.notebooks import NotebookStep, SingleNotebookDirStep
 
+_HISTORICAL_EMISSIONS_SUBDIR = (
+    Path("input4MIPs") / "CMIP6" / "CMIP" / "CR" / "CR-historical"
+)
+"""
+Location of the historical emissions within the input4MIPs results archive
+"""
+
 
 def get_notebook_steps_historical(
     config: Config, raw_notebooks_dir: Path, stub: str
@@ -41,12 +49,21 @@ def get_notebook_steps_historical(
         Historical notebook steps to run
     """
     historical_emissions_dir = (
-        config.input4mips_archive.results_archive
-        / "input4MIPs"
-        / "CMIP6"
-        / "CMIP"
-        / "CR"
-        / "CR-historical"
+        config.input4mips_archive.results_archive / _HISTORICAL_EMISSIONS_SUBDIR
+    )
+
+    # Checklists which are shared between steps
+    zenodo_data_checklist = get_checklist_file(
+        config.gridding_preparation.zenoda_data_archive
+    )
+    gridding_proxies_checklist = get_checklist_file(
+        config.gridding_preparation.output_dir
+    )
+    cmip6_raw_data_checklist = get_checklist_file(
+        config.cmip6_concentrations.root_raw_data_dir
+    )
+    historical_gridding_checklist = get_checklist_file(
+        config.historical_h2_gridding.output_directory
     )
 
     steps = [
@@ -58,7 +75,7 @@ def get_notebook_steps_historical(
             configuration=(),
             dependencies=(config.gridding_preparation.raw_rscript,),
             targets=(
-                get_checklist_file(config.gridding_preparation.zenoda_data_archive),
+                zenodo_data_checklist,
                 config.gridding_preparation.output_rscript,
             ),
         ),
@@ -70,9 +87,9 @@ def get_notebook_steps_historical(
             configuration=(config.gridding_preparation.output_dir,),
             dependencies=(
                 config.gridding_preparation.output_rscript,
-                get_checklist_file(config.gridding_preparation.zenoda_data_archive),
+                zenodo_data_checklist,
             ),
-            targets=(get_checklist_file(config.gridding_preparation.output_dir),),
+            targets=(gridding_proxies_checklist,),
         ),
         SingleNotebookDirStep(
             name="Download CMIP6 concentrations",
@@ -81,9 +98,7 @@ def get_notebook_steps_historical(
             raw_notebook_ext=".py",
             configuration=(config.cmip6_concentrations,),
             dependencies=(),
-            targets=(
-                get_checklist_file(config.cmip6_concentrations.root_raw_data_dir),
-            ),
+            targets=(cmip6_raw_data_checklist,),
         ),
         SingleNotebookDirStep(
             name="Extract CMIP6 grids",
@@ -94,9 +109,7 @@ def get_notebook_steps_historical(
                 config.cmip6_concentrations.concentration_scenario_ids,
                 config.cmip6_concentrations.concentration_variables,
             ),
-            dependencies=(
-                get_checklist_file(config.cmip6_concentrations.root_raw_data_dir),
-            ),
+            dependencies=(cmip6_raw_data_checklist,),
             targets=(
                 config.concentration_gridding.cmip6_seasonality_and_latitudinal_gradient_path,
             ),
@@ -137,11 +150,9 @@ def get_notebook_steps_historical(
             configuration=(config.historical_h2_gridding,),
             dependencies=(
                 config.historical_h2_emissions.baseline_h2_emissions_countries,
-                get_checklist_file(config.gridding_preparation.output_dir),
-            ),
-            targets=(
-                get_checklist_file(config.historical_h2_gridding.output_directory),
+                gridding_proxies_checklist,
             ),
+            targets=(historical_gridding_checklist,),
         ),
         SingleNotebookDirStep(
             name="write historical input4MIPS results",
@@ -153,9 +164,7 @@ def get_notebook_steps_historical(
                 config.input4mips_archive.local_archive,
                 config.input4mips_archive.version,
             ),
-            dependencies=(
-                get_checklist_file(config.historical_h2_gridding.output_directory),
-            ),
+            dependencies=(historical_gridding_checklist,),
             targets=(
                 get_checklist_file(historical_emissions_dir),
                 config.input4mips_archive.complete_file_emissions_historical,
@@ -163,14 +172,13 @@ def get_notebook_steps_historical(
         ),
     ]
 
-    out = tuple(
-        sds.to_notebook_step(
-            raw_notebooks_dir=raw_notebooks_dir,
-            output_notebook_dir=config.historical_notebook_dir,
-            stub=stub,
-        )
-        for sds in steps
+    to_notebook_step = functools.partial(
+        SingleNotebookDirStep.to_notebook_step,
+        raw_notebooks_dir=raw_notebooks_dir,
+        output_notebook_dir=config.historical_notebook_dir,
+        stub=stub,
     )
+    out = tuple(map(to_notebook_step, steps))
 
     return out
 
@@ -201,13 +209,15 @@ def get_notebook_steps_scenario(
     -------
         Notebook steps to run
     """
-    (
-        config.input4mips_archive.results_archive
-        / "input4MIPs"
-        / "CMIP6"
-        / "ScenarioMIP"
-        / "CR"
-        / f"CR-{config.name}"
+    # Checklists which are shared between steps
+    gridding_proxies_checklist = get_checklist_file(
+        config.gridding_preparation.output_dir
+    )
+    projected_gridding_checklist = get_checklist_file(
+        config.projected_gridding.output_directory
+    )
+    interim_gridded_concentrations_checklist = get_checklist_file(
+        config.concentration_gridding.interim_gridded_output_dir
     )
 
     # Projected Emissions steps
@@ -221,8 +231,11 @@ def get_notebook_steps_scenario(
                 config.emissions.cleaning_operations,
                 config.emissions.metadata,
             ),
+            # Deduplicated while preserving the order of the operations
             dependencies=tuple(
-                set(op.input_file for op in config.emissions.cleaning_operations)
+                dict.fromkeys(
+                    op.input_file for op in config.emissions.cleaning_operations
+                )
             ),
             targets=(config.emissions.input_scenario,),
         ),
@@ -322,9 +335,9 @@ def get_notebook_steps_scenario(
             configuration=(config.projected_gridding,),
             dependencies=(
                 config.emissions.complete_scenario_countries,
-                get_checklist_file(config.gridding_preparation.output_dir),
+                gridding_proxies_checklist,
             ),
-            targets=(get_checklist_file(config.projected_gridding.output_directory),),
+            targets=(projected_gridding_checklist,),
         ),
         SingleNotebookDirStep(
             name="write projected input4MIPS results",
@@ -332,9 +345,7 @@ def get_notebook_steps_scenario(
             notebook="200_projected_h2_emissions/260_write_projected_input4MIPs",
             raw_notebook_ext=".py",
             configuration=(config.input4mips_archive,),
-            dependencies=(
-                get_checklist_file(config.projected_gridding.output_directory),
-            ),
+            dependencies=(projected_gridding_checklist,),
             targets=(config.input4mips_archive.complete_file_emissions_scenario,),
         ),
     ]
@@ -388,11 +399,7 @@ def get_notebook_steps_scenario(
                 config.rcmip.concentrations_path,
                 config.magicc_runs.output_file,
             ),
-            targets=(
-                get_checklist_file(
-                    config.concentration_gridding.interim_gridded_output_dir
-                ),
-            ),
+            targets=(interim_gridded_concentrations_checklist,),
         ),
         SingleNotebookDirStep(
             name="Write input4MIPs concentrations",
@@ -400,11 +407,7 @@ def get_notebook_steps_scenario(
             notebook="300_projected_concentrations/330_write-input4MIPs-files",
             raw_notebook_ext=".py",
             configuration=(),
-            dependencies=(
-                get_checklist_file(
-                    config.concentration_gridding.interim_gridded_output_dir
-                ),
-            ),
+            dependencies=(interim_gridded_concentrations_checklist,),
             targets=(config.input4mips_archive.complete_file_concentrations,),
         ),
     ]
@@ -448,18 +451,22 @@ def get_notebook_steps_scenario(
             for spatial_emis_region in config.spatial_emissions
         )
     )
-    out = [
-        sds.to_notebook_step(
-            raw_notebooks_dir=raw_notebooks_dir,
-            output_notebook_dir=config.output_notebook_dir,
-            stub=stub,
+    to_notebook_step = functools.partial(
+        SingleNotebookDirStep.to_notebook_step,
+        raw_notebooks_dir=raw_notebooks_dir,
+        output_notebook_dir=config.output_notebook_dir,
+        stub=stub,
+    )
+    out = list(
+        map(
+            to_notebook_step,
+            itertools.chain(
+                projected_emissions_steps,
+                concentration_gridding_steps,
+                spatial_emissions_steps,
+            ),
         )
-        for sds in [
-            *projected_emissions_steps,
-            *concentration_gridding_steps,
-            *spatial_emissions_steps,
-        ]
-    ]
+    )
 
     return out
 
@@ -541,14 +548,13 @@ def get_notebook_steps_finalise(
         ),
     ]
 
-    out = tuple(
-        sds.to_notebook_step(
-            raw_notebooks_dir=raw_notebooks_dir,
-            output_notebook_dir=finalisation_notebook_dir,
-            stub=stub,
-        )
-        for sds in steps
+    to_notebook_step = functools.partial(
+        SingleNotebookDirStep.to_notebook_step,
+        raw_notebooks_dir=raw_notebooks_dir,
+        output_notebook_dir=finalisation_notebook_dir,
+        stub=stub,
     )
+    out = tuple(map(to_notebook_step, steps))
 
     return out
 
@@ -0,0 +1,12 @@
+import pytest
+
+from local.pydoit_nb.cache import CACHE_DIR_ENV_VAR
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path_factory, monkeypatch):
+    # Keep any on-disk caches out of the user's cache directory
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(cache_dir))
+
+    return cache_dir
@@ -0,0 +1,41 @@
+import os
+
+from local.pydoit_nb import cache
+from local.pydoit_nb.cache import get_cache_file, read_cache_file, write_cache_file
+
+
+def test_cache_file_roundtrip(tmp_path):
+    cache_file = get_cache_file("test", tmp_path, ".txt")
+
+    write_cache_file(cache_file, lambda fh: fh.write(b"cached"))
+
+    assert read_cache_file(cache_file, lambda fh: fh.read()) == b"cached"
+    # Only the cache is left behind
+    assert [p.name for p in cache_file.parent.iterdir()] == [cache_file.name]
+
+
+def test_read_cache_file_missing(tmp_path):
+    assert read_cache_file(tmp_path / "missing", lambda fh: fh.read()) is None
+
+
+def test_read_cache_file_untrusted(tmp_path):
+    cache_file = get_cache_file("test", tmp_path, ".txt")
+    write_cache_file(cache_file, lambda fh: fh.write(b"cached"))
+
+    # Another user could have written the cache
+    cache_file.chmod(0o666)
+
+    assert read_cache_file(cache_file, lambda fh: fh.read()) is None
+
+
+def test_write_cache_file_prunes(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "MAX_CACHE_FILES", 2)
+
+    cache_files = [get_cache_file("test", tmp_path / str(i), ".txt") for i in range(3)]
+    for i, cache_file in enumerate(cache_files):
+        write_cache_file(cache_file, lambda fh: fh.write(b"cached"))
+        # Written in order, the first being the oldest
+        os.utime(cache_file, ns=(i * 10**9, i * 10**9))
+
+    # The least recently written cache is removed
+    assert sorted(cache_files[0].parent.iterdir()) == sorted(cache_files[1:])
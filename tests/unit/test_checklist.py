@@ -0,0 +1,83 @@
+import hashlib
+
+from local.pydoit_nb import cache, checklist
+from local.pydoit_nb.checklist import generate_directory_checklist
+
+
+def test_generate_directory_checklist(tmp_path):
+    (tmp_path / "sub").mkdir()
+    contents = {
+        "b.txt": b"b",
+        "sub/a.nc": b"a" * 100_000,
+        "a.txt": b"",
+    }
+    for fname, content in contents.items():
+        (tmp_path / fname).write_bytes(content)
+
+    checklist_file = generate_directory_checklist(tmp_path)
+    # Existing checklists aren't included when regenerating
+    assert generate_directory_checklist(tmp_path) == checklist_file
+
+    exp = "".join(
+        f"MD5 ({fname}) = {hashlib.md5(contents[fname]).hexdigest()}\n"  # noqa: S324
+        for fname in ("a.txt", "b.txt", "sub/a.nc")
+    )
+    assert checklist_file.read_text() == exp
+
+
+def test_generate_directory_checklist_modified(tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"a")
+    checklist_file = generate_directory_checklist(tmp_path)
+
+    (tmp_path / "a.txt").write_bytes(b"modified")
+    generate_directory_checklist(tmp_path)
+
+    exp_md5 = hashlib.md5(b"modified").hexdigest()  # noqa: S324
+    assert checklist_file.read_text() == f"MD5 (a.txt) = {exp_md5}\n"
+
+
+def test_generate_directory_checklist_cached(tmp_path, monkeypatch):
+    (tmp_path / "a.txt").write_bytes(b"a")
+    (tmp_path / "b.txt").write_bytes(b"b")
+    checklist_file = generate_directory_checklist(tmp_path)
+    exp = checklist_file.read_text()
+
+    hashed = []
+
+    def _get_file_md5(path):
+        hashed.append(path.name)
+        return hashlib.md5(path.read_bytes()).hexdigest()  # noqa: S324
+
+    monkeypatch.setattr(checklist, "_get_file_md5", _get_file_md5)
+
+    # Unchanged files are served from the cache
+    assert generate_directory_checklist(tmp_path) == checklist_file
+    assert checklist_file.read_text() == exp
+    assert not hashed
+
+    (tmp_path / "b.txt").write_bytes(b"modified")
+    generate_directory_checklist(tmp_path)
+    assert hashed == ["b.txt"]
+
+
+def test_generate_directory_checklist_cache_location(tmp_path, cache_dir):
+    (tmp_path / "a.txt").write_bytes(b"a")
+    generate_directory_checklist(tmp_path)
+
+    # Only the checklist is written to the directory
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.txt", "checklist.chk"]
+    assert list((cache_dir / "checklist").iterdir())
+
+
+def test_generate_directory_checklist_cache_bounded(tmp_path, cache_dir, monkeypatch):
+    max_files = 2
+    monkeypatch.setattr(cache, "MAX_CACHE_FILES", max_files)
+
+    # e.g. the output directories of separate runs
+    for i in range(5):
+        directory = tmp_path / f"run-{i}"
+        directory.mkdir()
+        (directory / "a.txt").write_bytes(b"a")
+        generate_directory_checklist(directory)
+
+    assert len(list((cache_dir / "checklist").iterdir())) == max_files
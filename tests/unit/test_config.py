@@ -0,0 +1,146 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from local import config
+from local.config import (
+    _get_config_cache_path,
+    _write_config_cache,
+    get_config_bundle,
+    load_config,
+    load_config_from_file,
+    write_config_file_in_output_dir,
+)
+from local.serialization import converter_yaml
+
+
+def test_config_cache_outside_config_dir(tmp_path, cache_dir):
+    cache_path = _get_config_cache_path(tmp_path / "config.yaml")
+
+    assert cache_path.is_relative_to(cache_dir)
+
+
+def test_write_config_cache_unwritable(tmp_path):
+    # The cache is optional so failing to write it isn't an error
+    (tmp_path / "file").touch()
+    cache_path = tmp_path / "file" / "config.yaml.pkl"
+
+    _write_config_cache({"a": 1}, (0, 0), cache_path)
+
+    assert not cache_path.exists()
+    assert [p.name for p in tmp_path.iterdir()] == ["file"]
+
+
+def test_config_cache_replaced_with_older_file(tmp_path, monkeypatch):
+    # Structuring is skipped so plain YAML can be used as the config
+    monkeypatch.setattr(config, "_structure_config", lambda raw: raw)
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("name: new")
+    assert load_config_from_file(str(config_file)) == {"name": "new"}
+    assert _get_config_cache_path(config_file).exists()
+
+    # Replaced by a file of the same size with an older modification time
+    # e.g. after ``cp -p``
+    mtime_ns = config_file.stat().st_mtime_ns
+    config_file.write_text("name: old")
+    os.utime(config_file, ns=(mtime_ns - 10**9, mtime_ns - 10**9))
+
+    assert load_config_from_file(str(config_file)) == {"name": "old"}
+
+
+ROOT_DIR = Path(__file__).parents[2]
+CONFIG_DIR = ROOT_DIR / "data" / "configuration"
+
+ROUNDTRIP_SCRIPT = """
+import sys
+
+from local.config import Config, load_config_from_file
+from local.serialization import converter_yaml
+
+config_file, method = sys.argv[1:]
+if method == "converter":
+    with open(config_file) as fh:
+        config = converter_yaml.loads(fh.read(), Config)
+else:
+    config = load_config_from_file(config_file)
+
+sys.stdout.write(converter_yaml.dumps(config))
+"""
+
+
+@pytest.mark.parametrize("method", ("converter", "cache"))
+def test_config_roundtrip_fresh_import(tmp_path, method):
+    cb = get_config_bundle(
+        CONFIG_DIR / "scenarios" / "ssp119-high.yaml",
+        output_root_dir=tmp_path,
+        run_id="test",
+        common_config_file=CONFIG_DIR / "common.yaml",
+        user_placeholder_file=CONFIG_DIR / "user.sample.yaml",
+    )
+    config_str = converter_yaml.dumps(cb.config_hydrated)
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(config_str)
+
+    def _roundtrip() -> str:
+        # The types are resolved lazily so this has to be checked in a fresh
+        # interpreter
+        args = [sys.executable, "-c", ROUNDTRIP_SCRIPT, str(config_file), method]
+        res = subprocess.run(
+            args,  # noqa: S603
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return res.stdout
+
+    assert _roundtrip() == config_str
+    if method == "cache":
+        # Loaded from the pickled cache so no structuring hooks are built
+        assert _get_config_cache_path(config_file).exists()
+        assert _roundtrip() == config_str
+
+
+def test_write_config_file_in_output_dir_no_cache(tmp_path, cache_dir):
+    cb = get_config_bundle(
+        CONFIG_DIR / "scenarios" / "ssp119-high.yaml",
+        output_root_dir=tmp_path,
+        run_id="test",
+        common_config_file=CONFIG_DIR / "common.yaml",
+        user_placeholder_file=CONFIG_DIR / "user.sample.yaml",
+    )
+
+    write_config_file_in_output_dir(cb)
+
+    assert cb.config_hydrated_path.exists()
+    # The cache is only populated when the config is loaded
+    assert not list(cache_dir.iterdir())
+
+
+@pytest.mark.parametrize("method", ("string", "file"))
+def test_load_config_returns_copy(tmp_path, method):
+    cb = get_config_bundle(
+        CONFIG_DIR / "scenarios" / "ssp119-high.yaml",
+        output_root_dir=tmp_path,
+        run_id="test",
+        common_config_file=CONFIG_DIR / "common.yaml",
+        user_placeholder_file=CONFIG_DIR / "user.sample.yaml",
+    )
+    write_config_file_in_output_dir(cb)
+    config_str = cb.config_hydrated_path.read_text()
+
+    def _load():
+        if method == "string":
+            return load_config(config_str)
+
+        return load_config_from_file(str(cb.config_hydrated_path))
+
+    config = _load()
+    n_extensions = len(config.delta_emissions.extensions)
+    config.delta_emissions.extensions.clear()
+
+    # Modifying a loaded config doesn't leak into later loads
+    assert len(_load().delta_emissions.extensions) == n_extensions
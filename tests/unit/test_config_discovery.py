@@ -0,0 +1,26 @@
+import pytest
+
+from local.pydoit_nb.config_discovery import merge_config_fragments
+
+
+@pytest.mark.parametrize(
+    "base,fragments,exp",
+    (
+        ({"a": 1}, ({"b": 2},), {"a": 1, "b": 2}),
+        ({"a": 1}, ({"a": 2}, {"a": 3}), {"a": 3}),
+        (
+            {"a": {"b": 1, "c": {"d": 2}}},
+            ({"a": {"c": {"e": 3}}},),
+            {"a": {"b": 1, "c": {"d": 2, "e": 3}}},
+        ),
+        ({"a": [1, 2]}, ({"a": [3]},), {"a": [3]}),
+        ({"a": {"b": 1}}, ({"a": "override"},), {"a": "override"}),
+        ({"a": "value"}, ({"a": {"b": 1}},), {"a": {"b": 1}}),
+    ),
+)
+def test_merge_config_fragments(base, fragments, exp):
+    res = merge_config_fragments(base, *fragments)
+
+    assert res == exp
+    # The base is modified in place
+    assert res is base
@@ -0,0 +1,27 @@
+import pytest
+from attrs import frozen
+
+from local.pydoit_nb.gen_notebook_tasks import _dump_configuration
+from local.serialization import converter_yaml
+
+
+@frozen
+class _Configuration:
+    value: object
+
+
+@pytest.mark.parametrize(
+    "configurations",
+    (
+        (1, True, 1.0),
+        ((1,), (True,), (1.0,)),
+        (_Configuration(1), _Configuration(True), _Configuration(1.0)),
+    ),
+)
+def test_dump_configuration_typed(configurations):
+    # The configurations are all equal but dump differently
+    for configuration in configurations:
+        exp = converter_yaml.dumps(configuration, sort_keys=True)
+        assert _dump_configuration(configuration) == exp
+
+    assert len({_dump_configuration(c) for c in configurations}) == len(configurations)
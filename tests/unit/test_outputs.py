@@ -0,0 +1,108 @@
+import cftime
+import numpy as np
+import numpy.testing as npt
+import pytest
+import xarray as xr
+
+from local.h2_adjust.outputs import (
+    GriddedEmissionsDataset,
+    Input4MIPsMetadata,
+    _generate_bounds,
+    find_gridded_slice,
+)
+
+
+@pytest.mark.parametrize(
+    "points,exp",
+    (
+        (np.arange(3), [[-0.5, 0.5], [0.5, 1.5], [1.5, 2.5]]),
+        (
+            np.array([-89.5, -88.5, -87.0]),
+            [[-90.0, -89.0], [-89.0, -87.75], [-87.75, -86.25]],
+        ),
+    ),
+)
+def test_generate_bounds(points, exp):
+    res = _generate_bounds(xr.DataArray(points, dims="x"))
+
+    assert res.dtype == np.float64
+    npt.assert_array_equal(res, exp)
+
+
+def test_generate_bounds_datetime64():
+    points = np.array(
+        ["2000-01-01", "2000-01-03", "2000-01-05"], dtype="datetime64[ns]"
+    )
+
+    res = _generate_bounds(points)
+
+    assert res.dtype == points.dtype
+    npt.assert_array_equal(
+        res,
+        np.array(
+            [
+                ["1999-12-31", "2000-01-02"],
+                ["2000-01-02", "2000-01-04"],
+                ["2000-01-04", "2000-01-06"],
+            ],
+            dtype="datetime64[ns]",
+        ),
+    )
+
+
+def test_generate_bounds_cftime():
+    points = np.array([cftime.DatetimeNoLeap(2000, 1, d) for d in (3, 5, 7)])
+
+    res = _generate_bounds(points)
+
+    assert res.tolist() == [
+        [cftime.DatetimeNoLeap(2000, 1, d) for d in bounds]
+        for bounds in ((2, 4), (4, 6), (6, 8))
+    ]
+
+
+def test_gridded_emissions_sector_bounds():
+    metadata = Input4MIPsMetadata(
+        contact="contact",
+        dataset_category="emissions",
+        frequency="mon",
+        further_info_url="url",
+        grid_label="gn",
+        institution="institution",
+        institution_id="institution_id",
+        nominal_resolution="50 km",
+        realm="atmos",
+        source="source",
+        source_id="source_id",
+        source_version="1.0.0",
+        target_mip="CMIP",
+        title="title",
+        variable_id="H2_em_anthro",
+    )
+    time = xr.DataArray(
+        [cftime.DatetimeNoLeap(2000, m, 15) for m in (1, 2)], dims="time", name="time"
+    )
+    lat = xr.DataArray([-45.0, 45.0], dims="lat", name="lat")
+    lon = xr.DataArray([-90.0, 90.0], dims="lon", name="lon")
+
+    ds = GriddedEmissionsDataset.create_empty(["a", "b", "c"], time, lat, lon, metadata)
+
+    npt.assert_array_equal(
+        ds.data["sector_bounds"], [[-0.5, 0.5], [0.5, 1.5], [1.5, 2.5]]
+    )
+
+
+def test_find_gridded_slice_new_file(tmp_path):
+    assert find_gridded_slice("H2", "Waste", "2000-2000", tmp_path) is None
+
+    # Written after the directory was first searched
+    (tmp_path / "sub").mkdir()
+    da = xr.DataArray(
+        np.arange(2.0), dims="lat", coords={"lat": [45.0, -45.0]}, name="H2"
+    )
+    da.to_netcdf(tmp_path / "sub" / "Emissions_H2_Waste_a_2000-2000.nc")
+
+    res = find_gridded_slice("H2", "Waste", "2000-2000", tmp_path)
+
+    npt.assert_array_equal(res.lat, [-45.0, 45.0])
+    npt.assert_array_equal(res, [1.0, 0.0])
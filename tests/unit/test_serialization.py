@@ -0,0 +1,36 @@
+import pytest
+
+from local.serialization import parse_placeholders
+
+
+@pytest.mark.parametrize(
+    "in_str,kwargs,exp",
+    (
+        ("Hi I am {name}!", {"name": "Tim"}, "Hi I am Tim!"),
+        ("{a}/{b}/{a}", {"a": "x", "b": 1}, "x/1/x"),
+        ("no placeholders", {"a": "x"}, "no placeholders"),
+        ("{{a}} {a}", {"a": "x"}, "{a} x"),
+        ("only closing }}", {}, "only closing }"),
+    ),
+)
+def test_parse_placeholders(in_str, kwargs, exp):
+    assert parse_placeholders(in_str, **kwargs) == exp
+
+
+def test_parse_placeholders_missing():
+    with pytest.raises(KeyError, match="missing"):
+        parse_placeholders("{missing}", name="Tim")
+
+
+@pytest.mark.parametrize(
+    "in_str",
+    (
+        "{output-root-dir}/x",
+        "{output_root_dir/x",
+        "{a.b}",
+        "x}/{a}",
+    ),
+)
+def test_parse_placeholders_malformed(in_str):
+    with pytest.raises(ValueError, match="Malformed placeholder"):
+        parse_placeholders(in_str, output_root_dir="out", a="x")
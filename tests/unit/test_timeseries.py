@@ -0,0 +1,154 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+import scmdata
+
+from local.h2_adjust.timeseries import TimeseriesExtension, extend
+
+NAN = np.nan
+
+# Interpolation is linear in time so uses the number of days between years.
+# The slope of region "A" is between 2011 and 2013 (including a leap year)
+SLOPE_A = 2 / (365 + 366)
+
+
+@pytest.fixture
+def data():
+    # Region "A" has leading, interior and trailing NaNs
+    return scmdata.ScmRun(
+        np.array([[NAN, 1, NAN, 3, NAN], [2, 2, 2, 2, 2]]).T,
+        index=[2010, 2011, 2012, 2013, 2014],
+        columns={
+            "model": "model",
+            "scenario": "scenario",
+            "region": ["A", "B"],
+            "variable": "Emissions|H2",
+            "unit": "Mt H2/yr",
+        },
+    )
+
+
+def _check(res, exp, start_year, end_year):
+    ts = res.timeseries()
+
+    npt.assert_array_equal(ts.columns.year, np.arange(start_year, end_year + 1))
+    assert ts.index.get_level_values("region").tolist() == ["A", "B"]
+    npt.assert_allclose(ts.to_numpy(), exp)
+
+
+@pytest.mark.parametrize(
+    "method,exp",
+    (
+        (
+            "constant",
+            [[1, 1, 1 + 365 * SLOPE_A, 3, 3, 3, 3], [2] * 7],
+        ),
+        (
+            "linear",
+            [
+                [
+                    1 - 365 * SLOPE_A,
+                    1,
+                    1 + 365 * SLOPE_A,
+                    3,
+                    3 + 365 * SLOPE_A,
+                    3 + 730 * SLOPE_A,
+                    3 + 1095 * SLOPE_A,
+                ],
+                [2] * 7,
+            ],
+        ),
+    ),
+)
+def test_extend_no_extensions(data, method, exp):
+    res = extend(data, [], method=method, start_year=2010, end_year=2016)
+
+    _check(res, exp, 2010, 2016)
+
+
+def test_extend_after_first_value(data):
+    extension = TimeseriesExtension(
+        filters={"region": "A"}, rate=0.1, start_year=2013, end_year=2016
+    )
+
+    res = extend(data, [extension], start_year=2010, end_year=2018)
+
+    # Only the extension is kept so the values before the start year are
+    # filled using the value in the start year
+    exp_a = [
+        3,
+        3,
+        3,
+        3,
+        3 * 1.1,
+        3 * 1.1**2,
+        3 * 1.1**3,
+        3 * 1.1**3,
+        3 * 1.1**3,
+    ]
+    _check(res, [exp_a, [2] * 9], 2010, 2018)
+
+
+def test_extend_per_row_start_year(data):
+    # Each timeseries starts from its first value if that is after the start
+    # year of the extension
+    extension = TimeseriesExtension(
+        filters={}, rate=0.1, start_year=2010, end_year=2013
+    )
+
+    res = extend(data, [extension], start_year=2010, end_year=2014)
+
+    exp = [
+        [1, 1, 1.1, 1.1**2, 1.1**2],
+        [2, 2 * 1.1, 2 * 1.1**2, 2 * 1.1**3, 2 * 1.1**3],
+    ]
+    _check(res, exp, 2010, 2014)
+
+
+def test_extend_rate_zero(data):
+    extension = TimeseriesExtension(
+        filters={"region": "A"}, rate=0, start_year=2011, end_year=2015
+    )
+
+    res = extend(data, [extension], start_year=2010, end_year=2016)
+
+    # Held at the value in the start year, ignoring any later values
+    _check(res, [[1] * 7, [2] * 7], 2010, 2016)
+
+
+def test_extend_chained(data):
+    extensions = [
+        TimeseriesExtension(filters={}, rate=0.1, start_year=2013, end_year=2015),
+        # Overlaps the previous extension which is used as the starting point
+        TimeseriesExtension(
+            filters={"region": "B"}, rate=-0.5, start_year=2014, end_year=2016
+        ),
+    ]
+
+    res = extend(data, extensions, start_year=2010, end_year=2017)
+
+    exp = [
+        [3, 3, 3, 3, 3 * 1.1, 3 * 1.1**2, 3 * 1.1**2, 3 * 1.1**2],
+        [2.2, 2.2, 2.2, 2.2, 2.2, 1.1, 0.55, 0.55],
+    ]
+    _check(res, exp, 2010, 2017)
+
+
+def test_extend_unmatched_filters(data):
+    extension = TimeseriesExtension(
+        filters={"region": "C"}, rate=0.1, start_year=2010, end_year=2016
+    )
+
+    res = extend(data, [extension], start_year=2010, end_year=2016)
+
+    _check(res, [[1, 1, 1 + 365 * SLOPE_A, 3, 3, 3, 3], [2] * 7], 2010, 2016)
+
+
+def test_extend_start_year_not_present(data):
+    # 2012 is missing for region "A"
+    extension = TimeseriesExtension(
+        filters={"region": "A"}, rate=0.1, start_year=2012, end_year=2016
+    )
+
+    with pytest.raises(ValueError, match="2012 not present"):
+        extend(data, [extension], start_year=2010, end_year=2016)
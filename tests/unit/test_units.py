@@ -1,6 +1,7 @@
 import numpy as np
 import numpy.testing as npt
 import pytest
+import scmdata
 from scmdata.testing import get_single_ts
 
 from local.h2_adjust.units import (
@@ -73,3 +74,14 @@ def test_convert_production_intensities(unit, carrier, product, exp):
     product_unit = "H" if product == "H2" else product
     assert res.get_unique_meta("unit", True) == f"kg {product_unit} / kg H"
     npt.assert_almost_equal(res.values, exp)
+
+
+@pytest.mark.parametrize(
+    "func",
+    (sanitize_combustion_intensity_units, sanitize_production_intensity_units),
+)
+def test_convert_intensities_empty(func):
+    res = func(scmdata.ScmRun())
+
+    assert isinstance(res, scmdata.ScmRun)
+    assert res.empty